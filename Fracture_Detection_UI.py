@@ -1,15 +1,197 @@
+import math
 import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QLabel, QFrame, QMessageBox, QPushButton
-from PyQt5.QtCore import QTimer, Qt
-from matplotlib.dates import DateFormatter
+from PyQt5.QtCore import QMutex, QThread, QWaitCondition, Qt, pyqtSignal
+from matplotlib.ticker import FuncFormatter, Locator
 from datetime import timedelta
+from numba import njit
+from rop_kernels import RED, READONLY_KERNEL_SIGNATURE, _gradient_and_classify
+
+# Set bigger fonts and thicker lines for all graphs, once and before any figure is created
+plt.rcParams.update({'font.size': 24, 'lines.linewidth': 3})
+
+# CSS color for each fracture detection category code (GREEN, YELLOW, ORANGE, RED in rop_kernels)
+COLOR_NAMES = ['green', 'yellow', 'orange', 'red']
+
+# Minimum time between two red alert pop-ups during a sustained fracture event
+RED_ALERT_COOLDOWN_SEC = 30
+
+# Plotted sensor signals; low-dynamic-range values that are kept as float32
+NUMERIC_COLS = ('Rate Of Penetration (ft_per_hr)', 'ROP Derivative', 'Weight on Bit (klbs)',
+                'Rotary RPM (RPM)', 'Hole Depth (feet)')
+
+# ROP derivative thresholds of the red, orange and yellow fracture detection categories
+RED_THRESHOLD, ORANGE_THRESHOLD, YELLOW_THRESHOLD = 4, 3.5, 3
+DERIVATIVE_THRESHOLD_LINES = [(RED_THRESHOLD, 'red'), (ORANGE_THRESHOLD, 'orange'), (YELLOW_THRESHOLD, 'yellow')]
+
+# Graphs shown left to right: (column, x-axis label, y-axis label, title, line color,
+# vertical threshold lines as (x, color))
+PANELS = [
+    ('Rate Of Penetration (ft_per_hr)', 'Rate of Penetration (ft/hr)', 'Time', 'ROP vs Time', 'blue', []),
+    ('ROP Derivative', 'ROP Derivative', None, 'ROP Derivative vs Time', 'green', DERIVATIVE_THRESHOLD_LINES),
+    ('Weight on Bit (klbs)', 'WOB (klbs)', None, 'Weight on Bit vs Time', 'purple', []),
+    ('Rotary RPM (RPM)', 'RPM', None, 'Rotary RPM vs Time', 'orange', []),
+    ('Hole Depth (feet)', 'Hole Depth (feet)', None, 'Hole Depth vs Time', 'brown', []),
+]
+
+# Upper bound on the number of vertices handed to each line artist per update
+MAX_PLOT_POINTS = 4000
+
+
+def peak_decimate(values, times, max_points=MAX_PLOT_POINTS):
+    """Reduce a series to per-bin min/max pairs so spikes survive while the vertex count stays bounded."""
+    n = len(values)
+    if n <= max_points:
+        return values, times
+
+    # Samples per bin, rounded up so that two points per bin fit within max_points
+    step = -(-2 * n // max_points)
+    n_bins = n // step
+    binned = values[:n_bins * step].reshape(n_bins, step)
+
+    decimated = np.empty(2 * n_bins, dtype=values.dtype)
+    decimated[0::2] = np.fmin.reduce(binned, axis=1)
+    decimated[1::2] = np.fmax.reduce(binned, axis=1)
+    # Pin each pair to the first and last sample time of its bin so the latest time is preserved
+    decimated_times = np.empty(2 * n_bins, dtype=times.dtype)
+    decimated_times[0::2] = times[:n_bins * step:step]
+    decimated_times[1::2] = times[step - 1:n_bins * step:step]
+
+    # Keep the trailing partial bin as-is so the newest samples are always drawn exactly
+    tail = n_bins * step
+    return np.concatenate((decimated, values[tail:])), np.concatenate((decimated_times, times[tail:]))
+
+
+class PeakBuffer:
+    """
+    Preallocated min/max summary of a growing series for the full-time view.
+
+    Samples are folded into bins of `step` samples, stored as interleaved (min, max) pairs. When
+    the buffer is full, adjacent bins are merged and the step doubles, so memory and per-update
+    work stay bounded no matter how long the session runs.
+    """
+
+    def __init__(self, values, times, n_bins=MAX_PLOT_POINTS // 2):
+        self.values = values
+        self.times = times
+        self.n_bins = n_bins
+        self.peaks = np.empty(2 * n_bins, dtype=values.dtype)
+        self.peak_times = np.empty(2 * n_bins, dtype=times.dtype)
+        self.step = 1  # Samples per bin
+        self.count = 0  # Number of filled bins
+        self.consumed = 0  # Number of samples folded into the filled bins
+
+    def series(self, end):
+        """Return (values, times) summarizing the first `end` samples, newest samples kept exact."""
+        self._fold(end)
+        filled = 2 * self.count
+        return (np.concatenate((self.peaks[:filled], self.values[self.consumed:end])),
+                np.concatenate((self.peak_times[:filled], self.times[self.consumed:end])))
+
+    def _fold(self, end):
+        """Fold every complete bin of samples before `end` into the buffer."""
+        while end - self.consumed >= self.step:
+            if self.count == self.n_bins:
+                self._merge()
+                continue
+            n_new = min((end - self.consumed) // self.step, self.n_bins - self.count)
+            stop = self.consumed + n_new * self.step
+            binned_values = self.values[self.consumed:stop].reshape(n_new, self.step)
+            binned_times = self.times[self.consumed:stop].reshape(n_new, self.step)
+            filled = slice(2 * self.count, 2 * (self.count + n_new))
+            self.peaks[filled][0::2] = np.fmin.reduce(binned_values, axis=1)
+            self.peaks[filled][1::2] = np.fmax.reduce(binned_values, axis=1)
+            self.peak_times[filled][0::2] = binned_times[:, 0]
+            self.peak_times[filled][1::2] = binned_times[:, -1]
+            self.count += n_new
+            self.consumed = stop
+
+    def _merge(self):
+        """Halve the resolution by merging adjacent bins, freeing half of the buffer."""
+        filled = 2 * self.count
+        half = filled // 2
+        mins = np.fmin(self.peaks[0:filled:4], self.peaks[2:filled:4])
+        maxs = np.fmax(self.peaks[1:filled:4], self.peaks[3:filled:4])
+        self.peaks[0:half:2] = mins
+        self.peaks[1:half:2] = maxs
+        self.peak_times[0:half:2] = self.peak_times[0:filled:4]
+        self.peak_times[1:half:2] = self.peak_times[3:filled:4]
+        self.count //= 2
+        self.step *= 2
+
+
+class TimeOfDayLocator(Locator):
+    """Place ticks on a seconds-since-midnight axis at round clock times."""
+    steps = (1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600, 43200, 86400)
+
+    def __init__(self, nbins=6):
+        self.nbins = nbins
+
+    def __call__(self):
+        vmin, vmax = self.axis.get_view_interval()
+        return self.tick_values(vmin, vmax)
+
+    def tick_values(self, vmin, vmax):
+        vmin, vmax = sorted((vmin, vmax))
+        step = next((s for s in self.steps if (vmax - vmin) / s <= self.nbins), self.steps[-1])
+        return np.arange(math.ceil(vmin / step), math.floor(vmax / step) + 1) * step
+
+
+def format_time_of_day(seconds, _pos=None):
+    """Format seconds since midnight as an HH:MM:SS tick label."""
+    seconds = int(seconds) % 86400
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+# Prefer the ahead-of-time compiled kernel built by build_kernels.py, which needs no JIT warm-up
+# at launch; fall back to compiling it just in time
+try:
+    from fracture_kernels import grad_classify
+except ImportError:
+    grad_classify = njit(READONLY_KERNEL_SIGNATURE, cache=True)(_gradient_and_classify)
+
+
+class DataFeeder(QThread):
+    """Background producer that announces the index of each newly available sample."""
+    new_sample = pyqtSignal(int)
+
+    def __init__(self, n_samples, interval_ms=1000, parent=None):
+        super().__init__(parent)
+        self.n_samples = n_samples
+        self.interval_ms = interval_ms
+        self.latest_index = -1  # Index of the most recently emitted sample
+        self._mutex = QMutex()
+        self._wake = QWaitCondition()
+
+    def run(self):
+        for index in range(self.n_samples):
+            # Wait out the interval on a condition that stop() can wake, unlike msleep
+            self._mutex.lock()
+            if not self.isInterruptionRequested():
+                self._wake.wait(self._mutex, self.interval_ms)
+            self._mutex.unlock()
+            if self.isInterruptionRequested():
+                return
+            self.latest_index = index
+            self.new_sample.emit(index)
+
+    def stop(self):
+        """Interrupt the feed, waking it from its wait between samples, and join the thread."""
+        self._mutex.lock()
+        self.requestInterruption()
+        self._wake.wakeAll()
+        self._mutex.unlock()
+        self.wait()
 
 
 class FractureDetectionApp(QMainWindow):
+    # Color box stylesheet for each category code, built once instead of formatted per update
+    COLOR_BOX_STYLES = tuple(f"background-color: {name};" for name in COLOR_NAMES)
+
     def __init__(self, edr_data):
         super().__init__()
 
@@ -22,23 +204,38 @@ class FractureDetectionApp(QMainWindow):
         # Process the data for fracture detection categories
         self.data = self.calculate_rop_derivative(self.data)
 
+        # Keep the columns used by the plotting loop as contiguous NumPy arrays and drop the DataFrame;
+        # the sensor signals are downcast to float32 to halve the bandwidth of every pass over them
+        self.cols = {name: self.data[name].to_numpy(dtype=np.float32) for name in NUMERIC_COLS}
+        self.cols['ROP Derivative Color'] = self.data['ROP Derivative Color'].to_numpy()
+        # Seconds since midnight of the first day: a monotonic float time axis for plotting and
+        # binary search that keeps increasing across midnight
+        date_time = self.data['DateTime'].to_numpy()
+        self.time_sec = (date_time - date_time[:1].astype('datetime64[D]')) / np.timedelta64(1, 's')
+        self.n_samples = len(self.data)
+        del self.data
+
+        # Bounded min/max summaries for the full-time view, so its per-update cost does not grow
+        # with the length of the session
+        self.peak_buffers = {name: PeakBuffer(self.cols[name], self.time_sec) for name in NUMERIC_COLS}
+
         # Initialize PyQt window
         self.initUI()
 
-        # Timer for real-time data simulation
-        self.timer = QTimer()
-        self.timer.setInterval(1000)  # 1 second interval
-        self.timer.timeout.connect(self.update_plot)
-        self.timer.start()
-
-        # Current index to simulate real-time data feed
-        self.current_index = 0
-        self.red_alert_start_time = None  # To track red alert durations
+        self._red_run = 0  # Number of consecutive red samples, to track red alert durations
+        self._last_color = None  # Last color code applied to the color box
+        self._last_alert_time = -np.inf  # Time (sec) of the last red alert pop-up in the current red run
+        self.alert_box = None  # Reused non-blocking red alert pop-up
 
         # Time range options for the graph view
         self.time_range = None  # None means entire time view
         self.time_ranges = [None, timedelta(minutes=5), timedelta(minutes=10), timedelta(minutes=30)]
 
+        # Background thread simulating the real-time data feed (one sample per second)
+        self.feeder = DataFeeder(self.n_samples, interval_ms=1000)
+        self.feeder.new_sample.connect(self.update_plot, Qt.QueuedConnection)
+        self.feeder.start()
+
     def initUI(self):
         """Initialize the GUI layout and components."""
         self.setWindowTitle("Real-time Fracture Detection")
@@ -54,29 +251,36 @@ class FractureDetectionApp(QMainWindow):
         graph_layout = QHBoxLayout()
         main_layout.addLayout(graph_layout)
 
-        # Initialize matplotlib figures and canvases for each graph
-        self.figure_rop, self.ax_rop = plt.subplots(figsize=(3, 15))
-        self.figure_rop_derivative, self.ax_rop_derivative = plt.subplots(figsize=(3, 15))
-        self.figure_wob, self.ax_wob = plt.subplots(figsize=(3, 15))
-        self.figure_rpm, self.ax_rpm = plt.subplots(figsize=(3, 15))
-        self.figure_depth_time, self.ax_depth_time = plt.subplots(figsize=(3, 15))
-
-        # Set bigger fonts and thicker lines for all graphs
-        plt.rcParams.update({'font.size': 24, 'lines.linewidth': 3})
-
-        # Create FigureCanvas for each graph
-        self.canvas_rop = FigureCanvas(self.figure_rop)
-        self.canvas_rop_derivative = FigureCanvas(self.figure_rop_derivative)
-        self.canvas_wob = FigureCanvas(self.figure_wob)
-        self.canvas_rpm = FigureCanvas(self.figure_rpm)
-        self.canvas_depth_time = FigureCanvas(self.figure_depth_time)
-
-        # Add the canvases to the graph layout
-        graph_layout.addWidget(self.canvas_rop)
-        graph_layout.addWidget(self.canvas_rop_derivative)
-        graph_layout.addWidget(self.canvas_wob)
-        graph_layout.addWidget(self.canvas_rpm)
-        graph_layout.addWidget(self.canvas_depth_time)
+        # Initialize matplotlib figures for each graph
+        figures = [plt.subplots(figsize=(3, 15)) for _ in PANELS]
+
+        # Create a canvas and a persistent line artist for each graph; the static axis setup is
+        # done once here and draw_panels only swaps the line data. The lines are animated, so a
+        # full draw renders only the static axes; that background is cached on every full draw
+        # (including resizes) and the lines are blitted over it
+        time_format = FuncFormatter(format_time_of_day)
+        self.panels = []
+        self.backgrounds = {}
+        self.rescale_pending = True
+        for (figure, ax), (column, xlabel, ylabel, title, color, threshold_lines) in zip(figures, PANELS):
+            canvas = FigureCanvas(figure)
+            graph_layout.addWidget(canvas)
+
+            line, = ax.plot([], [], color=color, animated=True)
+            ax.set_xlabel(xlabel)
+            if ylabel:
+                ax.set_ylabel(ylabel)
+            ax.set_title(title)
+            for threshold, threshold_color in threshold_lines:
+                ax.axvline(x=threshold, color=threshold_color, linestyle='--', label=f'{threshold_color.capitalize()} Threshold')
+
+            # Time runs down the y-axis with the most recent data at the bottom, labelled as HH:MM:SS
+            ax.yaxis.set_major_locator(TimeOfDayLocator())
+            ax.yaxis.set_major_formatter(time_format)
+            ax.invert_yaxis()
+
+            canvas.mpl_connect('draw_event', lambda event, ax=ax, line=line: self.cache_background(event.canvas, ax, line))
+            self.panels.append((column, canvas, ax, line))
 
         # Create a color box to show the current fracture detection category for the ROP Derivative graph
         self.color_box = QFrame()
@@ -94,156 +298,149 @@ class FractureDetectionApp(QMainWindow):
 
     def convert_time_to_seconds(self, df):
         """Convert HH:MM:SS to seconds and then format it as DateTime."""
-        df['DateTime'] = pd.to_datetime(df['YYYY/MM/DD'] + ' ' + df['HH:MM:SS'])
-        df['Time (sec)'] = pd.to_timedelta(df['HH:MM:SS']).dt.total_seconds()
+        # An explicit format skips per-row format inference, and the cache parses each of the
+        # heavily repeated date/time strings only once
+        df['DateTime'] = pd.to_datetime(df['YYYY/MM/DD'] + ' ' + df['HH:MM:SS'], format='%Y/%m/%d %H:%M:%S', cache=True)
+        # Derive seconds since midnight from the parsed timestamps instead of parsing HH:MM:SS again
+        df['Time (sec)'] = (df['DateTime'] - df['DateTime'].dt.normalize()).dt.total_seconds().to_numpy()
         return df
 
     def calculate_rop_derivative(self, filtered_data):
-        red, orange, yellow = 4, 3.5, 3
+        red, orange, yellow = RED_THRESHOLD, ORANGE_THRESHOLD, YELLOW_THRESHOLD
         """
-        Calculates ROP derivatives using np.gradient and assigns color categories based on thresholds.
+        Calculates ROP derivatives on the non-uniform time grid and assigns color category codes based on thresholds.
         """
         filtered_data = filtered_data.copy()  # Make a copy to avoid changing the original data
-        filtered_data['ROP Derivative'] = np.nan  # Create an empty column
-
-        # Calculate ROP derivative using np.gradient for each group
-        rop_values = filtered_data['Rate Of Penetration (ft_per_hr)'].values
-        time_values = filtered_data['Time (sec)'].values
-        if len(rop_values) > 1:
-            rop_derivative = np.gradient(rop_values, time_values)
-            filtered_data['ROP Derivative'] = rop_derivative
-
-        # Determine color categories based on thresholds
-        conditions = [
-            (filtered_data['ROP Derivative'] > red),
-            (filtered_data['ROP Derivative'] > orange) & (filtered_data['ROP Derivative'] <= red),
-            (filtered_data['ROP Derivative'] > yellow) & (filtered_data['ROP Derivative'] <= orange)
-        ]
-        colors = ['Red', 'Orange', 'Yellow']  # Matching the number of conditions
-
-        # Assign colors based on conditions
-        filtered_data['ROP Derivative Color'] = np.select(conditions, colors, default='Green')
 
-        return filtered_data
-
-    def update_plot(self):
-        red, orange, yellow = 4, 3.5, 3
-        """Update the plot with real-time data."""
-        if self.current_index >= len(self.data):
-            self.timer.stop()
-            return
+        # Calculate the ROP derivative and its color category code in a single fused pass; np.array
+        # copies into writable float32 arrays, since under pandas Copy-on-Write to_numpy() can return a
+        # read-only view of a column that is already float32
+        rop_values = np.array(filtered_data['Rate Of Penetration (ft_per_hr)'], dtype=np.float32)
+        time_values = np.array(filtered_data['Time (sec)'], dtype=np.float32)
+        rop_derivative, color_codes = grad_classify(rop_values, time_values, red, orange, yellow)
+        filtered_data['ROP Derivative'] = rop_derivative
+        filtered_data['ROP Derivative Color'] = color_codes
 
-        # Get the current slice of data up to current_index
-        latest_data = self.data.iloc[:self.current_index]
+        return filtered_data
 
-        # Apply time filtering for last 5, 10, or 30 minutes view
-        if self.time_range:
-            min_time = latest_data['DateTime'].max() - self.time_range
-            latest_data = latest_data[latest_data['DateTime'] >= min_time]
-
-        # Clear previous plots
-        self.ax_rop.clear()
-        self.ax_rop_derivative.clear()
-        self.ax_wob.clear()
-        self.ax_rpm.clear()
-        self.ax_depth_time.clear()
-
-        # Plot ROP (Rate of Penetration) vs Time
-        self.ax_rop.plot(latest_data['Rate Of Penetration (ft_per_hr)'], latest_data['DateTime'], color='blue')
-        self.ax_rop.set_xlabel('Rate of Penetration (ft/hr)')
-        self.ax_rop.set_ylabel('Time')
-        self.ax_rop.set_title('ROP vs Time')
-        self.ax_rop.invert_yaxis()  # Most recent data at the bottom
-
-        # Plot ROP Derivative vs Time with vertical threshold lines
-        self.ax_rop_derivative.plot(latest_data['ROP Derivative'], latest_data['DateTime'], color='green')
-        self.ax_rop_derivative.axvline(x=red, color='red', linestyle='--', label='Red Threshold')
-        self.ax_rop_derivative.axvline(x=orange, color='orange', linestyle='--', label='Red Threshold')
-        self.ax_rop_derivative.axvline(x=yellow, color='yellow', linestyle='--', label='Red Threshold')
-        self.ax_rop_derivative.set_xlabel('ROP Derivative')
-        self.ax_rop_derivative.set_title('ROP Derivative vs Time')
-        self.ax_rop_derivative.invert_yaxis()  # Most recent data at the bottom
-
-        # Plot Weight on Bit (klbs) vs Time
-        self.ax_wob.plot(latest_data['Weight on Bit (klbs)'], latest_data['DateTime'], color='purple')
-        self.ax_wob.set_xlabel('WOB (klbs)')
-        self.ax_wob.set_title('Weight on Bit vs Time')
-        self.ax_wob.invert_yaxis()  # Most recent data at the bottom
-
-        # Plot Rotary RPM vs Time
-        self.ax_rpm.plot(latest_data['Rotary RPM (RPM)'], latest_data['DateTime'], color='orange')
-        self.ax_rpm.set_xlabel('RPM')
-        self.ax_rpm.set_title('Rotary RPM vs Time')
-        self.ax_rpm.invert_yaxis()  # Most recent data at the bottom
-
-        # Plot Hole Depth (feet) vs Time
-        self.ax_depth_time.plot(latest_data['Hole Depth (feet)'], latest_data['DateTime'], color='brown')
-        self.ax_depth_time.set_xlabel('Hole Depth (feet)')
-        self.ax_depth_time.set_title('Hole Depth vs Time')
-        self.ax_depth_time.invert_yaxis()  # Most recent data at the bottom
-
-        # Format time axis as DateTime on all graphs
-        date_format = DateFormatter("%H:%M:%S")
-        self.ax_rop.yaxis.set_major_formatter(date_format)
-        self.ax_rop_derivative.yaxis.set_major_formatter(date_format)
-        self.ax_wob.yaxis.set_major_formatter(date_format)
-        self.ax_rpm.yaxis.set_major_formatter(date_format)
-        self.ax_depth_time.yaxis.set_major_formatter(date_format)
-
-        # Redraw the canvases to show the updated plots
-        self.canvas_rop.draw()
-        self.canvas_rop_derivative.draw()
-        self.canvas_wob.draw()
-        self.canvas_rpm.draw()
-        self.canvas_depth_time.draw()
+    def update_plot(self, new_index):
+        """Update the plot and fracture alerts for the newly arrived sample new_index."""
+        # If a newer sample is already queued behind this one, skip drawing this stale frame and
+        # let that update draw everything, so slow frames coalesce instead of piling up
+        if new_index >= self.feeder.latest_index:
+            self.draw_panels(new_index + 1)
 
         # Check for "Red" alerts (Fracture Detected)
-        if not latest_data.empty:
-            current_color = latest_data['ROP Derivative Color'].iloc[-1]  # Get the last detected color
-            self.update_color_box(current_color)
-
-            # Handle red alert pop-up if condition is met for more than 2 seconds
-            if current_color == 'Red':
-                if self.red_alert_start_time is None:
-                    self.red_alert_start_time = latest_data['DateTime'].iloc[-1]
-                elif (latest_data['DateTime'].iloc[-1] - self.red_alert_start_time).total_seconds() > 2:
-                    self.trigger_red_alert(latest_data['ROP Derivative'].iloc[-1], 2)
+        current_color = self.cols['ROP Derivative Color'][new_index]  # Get the last detected color code
+        self.update_color_box(current_color)
+
+        # Handle red alert pop-up if condition is met for more than 2 seconds; samples arrive at 1 Hz,
+        # so that is a run of more than 3 consecutive red samples
+        if current_color == RED:
+            self._red_run += 1
+            if self._red_run > 3 and self.time_sec[new_index] - self._last_alert_time >= RED_ALERT_COOLDOWN_SEC:
+                self._last_alert_time = self.time_sec[new_index]
+                self.trigger_red_alert(self.cols['ROP Derivative'][new_index], 2)
+        else:
+            # The cool-down only throttles repeats within one sustained event
+            self._red_run = 0
+            self._last_alert_time = -np.inf
+
+    def draw_panels(self, end):
+        """Draw the samples before index end on all panels."""
+        # Start at the first sample inside the last 5, 10, or 30 minutes when a time view is selected
+        start = 0
+        if self.time_range:
+            min_time = self.time_sec[end - 1] - self.time_range.total_seconds()
+            start = np.searchsorted(self.time_sec[:end], min_time)
+
+        # Swap the new data into the persistent line artists, decimated to a bounded vertex count, and
+        # only fully redraw a canvas when its limits must change; otherwise blit the line over the
+        # cached background
+        time_values = self.time_sec[start:end]
+        for column, canvas, ax, line in self.panels:
+            if self.time_range:
+                line.set_data(*peak_decimate(self.cols[column][start:end], time_values))
             else:
-                self.red_alert_start_time = None
-
-        # Increment the index for the next update
-        self.current_index += 1
+                line.set_data(*self.peak_buffers[column].series(end))
+            if self.rescale_pending or ax not in self.backgrounds or self.data_outside_view(ax, line):
+                ax.relim()
+                ax.autoscale_view()
+                # Leave headroom (at least one minute) below the latest sample so the following
+                # ticks can still be blitted
+                time_min, time_max = ax.get_ybound()
+                ax.set_ybound(time_min, time_max + max((time_max - time_min) * 0.1, 60))
+                canvas.draw()
+            else:
+                canvas.restore_region(self.backgrounds[ax])
+                ax.draw_artist(line)
+                canvas.blit(ax.bbox)
+        self.rescale_pending = False
+
+    def cache_background(self, canvas, ax, line):
+        """Cache the static background of a panel after a full draw and paint its line on top."""
+        self.backgrounds[ax] = canvas.copy_from_bbox(ax.bbox)
+        ax.draw_artist(line)
+
+    @staticmethod
+    def data_outside_view(ax, line):
+        """Return True if the line data extends past the current view limits of its axis."""
+        xy = line.get_xydata()
+        if len(xy) == 0:
+            return False
+        x_min, x_max = ax.get_xbound()
+        time_min, time_max = ax.get_ybound()
+        return bool(np.fmin.reduce(xy[:, 0]) < x_min or np.fmax.reduce(xy[:, 0]) > x_max
+                    or xy[0, 1] < time_min or xy[-1, 1] > time_max)
+
+    def closeEvent(self, event):
+        """Stop the data feeder thread before the window closes."""
+        self.feeder.stop()
+        super().closeEvent(event)
 
     def update_color_box(self, color):
         """Update the color box based on current fracture detection level."""
-        color_map = {
-            'Green': 'green',
-            'Yellow': 'yellow',
-            'Orange': 'orange',
-            'Red': 'red'
-        }
-        self.color_box.setStyleSheet(f"background-color: {color_map[color]};")
+        # setStyleSheet re-parses the CSS and re-polishes the widget, so skip unchanged colors
+        if color == self._last_color:
+            return
+        self._last_color = color
+        self.color_box.setStyleSheet(self.COLOR_BOX_STYLES[color])
 
     def trigger_red_alert(self, rop_value, duration):
         """Trigger a pop-up alert for a red alert."""
-        msg = QMessageBox()
-        msg.setIcon(QMessageBox.Warning)
-        msg.setWindowTitle("Fracture Detected")
-        msg.setText(f"ROP DERIVATIVE > {rop_value:.2f} for {duration} seconds.\nDrilling with ROP recommended due to fractures.")
-        msg.exec_()
+        # Show a modeless pop-up instead of exec_(), which would block the event loop and stall
+        # plotting until the alert is dismissed; reuse it so repeated alerts don't stack up
+        if self.alert_box is None:
+            self.alert_box = QMessageBox(self)
+            self.alert_box.setIcon(QMessageBox.Warning)
+            self.alert_box.setWindowTitle("Fracture Detected")
+            self.alert_box.setWindowModality(Qt.NonModal)
+        self.alert_box.setText(f"ROP DERIVATIVE > {rop_value:.2f} for {duration} seconds.\nDrilling with ROP recommended due to fractures.")
+        self.alert_box.show()
 
     def toggle_time_view(self):
         """Toggle between the entire time view and the selected time views."""
         # Cycle through the available time ranges (None for all, 5, 10, 30 min)
         current_idx = self.time_ranges.index(self.time_range)
         self.time_range = self.time_ranges[(current_idx + 1) % len(self.time_ranges)]
+        self.rescale_pending = True
 
 
 # Main application entry point
 def main():
     # Load real CSV data from file path
     file_path = r"C:\Users\trsch\Downloads\29301709.csv"
-    edr_data = pd.read_csv(file_path)
+    # Read only the columns the app uses with the multithreaded pyarrow parser; the date and time
+    # columns stay strings so pyarrow does not infer time32 values for HH:MM:SS
+    edr_data = pd.read_csv(
+        file_path,
+        engine='pyarrow',
+        usecols=['YYYY/MM/DD', 'HH:MM:SS', 'Hole Depth (feet)', 'Rate Of Penetration (ft_per_hr)',
+                 'Weight on Bit (klbs)', 'Rotary RPM (RPM)'],
+        dtype={'YYYY/MM/DD': str, 'HH:MM:SS': str, 'Hole Depth (feet)': 'float32',
+               'Rate Of Penetration (ft_per_hr)': 'float32', 'Weight on Bit (klbs)': 'float32',
+               'Rotary RPM (RPM)': 'float32'},
+    )
 
     # Create the application and main window
     app = QApplication(sys.argv)
@@ -0,0 +1,16 @@
+"""
+Compile the fused ROP derivative kernel ahead of time into the fracture_kernels extension module.
+
+Run `python build_kernels.py` once from this directory; Fracture_Detection_UI.py then imports
+grad_classify from the compiled module instead of JIT-compiling it on launch.
+"""
+from numba.pycc import CC
+
+from rop_kernels import KERNEL_SIGNATURE, _gradient_and_classify
+
+cc = CC('fracture_kernels')
+cc.export('grad_classify', KERNEL_SIGNATURE)(_gradient_and_classify)
+
+
+if __name__ == '__main__':
+    cc.compile()
@@ -0,0 +1,74 @@
+"""
+Numba kernels for the ROP derivative, kept free of Qt and Matplotlib so that build_kernels.py
+can compile them ahead of time without importing the GUI.
+"""
+import math
+
+import numpy as np
+from numba import njit, types
+
+# Fracture detection categories, stored as int8 codes in the 'ROP Derivative Color' column
+GREEN, YELLOW, ORANGE, RED = 0, 1, 2, 3
+
+
+@njit(cache=True)
+def _category(value, red, orange, yellow):
+    """Return the fracture detection category code for a single ROP derivative."""
+    if value > red:
+        return RED
+    if value > orange:
+        return ORANGE
+    if value > yellow:
+        return YELLOW
+    return GREEN  # Also covers NaN derivatives
+
+
+@njit(cache=True)
+def _divide(num, den):
+    """IEEE float division (x / 0 gives +-inf or NaN) regardless of the Numba error model."""
+    if den == 0:
+        if num == 0 or num != num:
+            return np.nan
+        return math.copysign(np.inf, num) * math.copysign(1.0, den)
+    return num / den
+
+
+# Signature of the fused kernel: (ROP, time, red, orange, yellow) -> (derivative, category codes)
+KERNEL_SIGNATURE = 'Tuple((float32[:], int8[:]))(float32[:], float32[:], float32, float32, float32)'
+
+# Signature for the JIT build. The pycc build accepts read-only inputs (e.g. pandas Copy-on-Write
+# views) through the signature above, but a JIT dispatcher only does so when its arrays are declared
+# read-only; writable arrays still convert to these, so this one definition accepts both
+_READONLY_FLOAT32 = types.Array(types.float32, 1, 'A', readonly=True)
+READONLY_KERNEL_SIGNATURE = types.Tuple((types.float32[:], types.int8[:]))(
+    _READONLY_FLOAT32, _READONLY_FLOAT32, types.float32, types.float32, types.float32)
+
+
+def _gradient_and_classify(rop, t, red, orange, yellow):
+    """
+    Compute d(ROP)/dt on the non-uniform time grid and classify it in one fused pass.
+
+    Matches np.gradient with edge_order=1: second-order central differences inside and
+    one-sided differences at the boundaries. Returns (derivative, int8 category codes).
+    Compiled ahead of time by build_kernels.py, or just in time by Fracture_Detection_UI.py.
+    """
+    n = rop.shape[0]
+    deriv = np.empty(n, dtype=np.float32)
+    codes = np.empty(n, dtype=np.int8)
+    if n < 2:
+        deriv[:] = np.nan
+        codes[:] = GREEN
+        return deriv, codes
+
+    deriv[0] = _divide(rop[1] - rop[0], t[1] - t[0])
+    codes[0] = _category(deriv[0], red, orange, yellow)
+    for i in range(1, n - 1):
+        dt_prev = t[i] - t[i - 1]
+        dt_next = t[i + 1] - t[i]
+        deriv[i] = (_divide(-dt_next, dt_prev * (dt_prev + dt_next)) * rop[i - 1]
+                    + _divide(dt_next - dt_prev, dt_prev * dt_next) * rop[i]
+                    + _divide(dt_prev, dt_next * (dt_prev + dt_next)) * rop[i + 1])
+        codes[i] = _category(deriv[i], red, orange, yellow)
+    deriv[n - 1] = _divide(rop[n - 1] - rop[n - 2], t[n - 1] - t[n - 2])
+    codes[n - 1] = _category(deriv[n - 1], red, orange, yellow)
+    return deriv, codes